@@ -48,10 +48,15 @@ class ClientSessionManager:
         if self._session:
             if not self._session.closed:
                 try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        loop.create_task(self.close())
+                    try:
+                        loop = asyncio.get_running_loop()
+                    except RuntimeError:
+                        # No loop running in this thread: close the session on the
+                        # loop it was created on without touching the thread's loop
+                        loop = self._session._loop
+                        if not (loop.is_closed() or loop.is_running()):
+                            loop.run_until_complete(self._session.close())
                     else:
-                        loop.run_until_complete(self.close())
+                        loop.create_task(self.close())
                 except Exception:
                     pass
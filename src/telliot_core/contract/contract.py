@@ -1,18 +1,40 @@
 """
 Utils for connecting to an EVM contract
 """
+import asyncio
+import functools
 import logging
+import time
 from typing import Any
+from typing import cast
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
+import aiohttp
 from chained_accounts import ChainedAccount
+from eth_account.datastructures import SignedTransaction
+from eth_account.signers.local import LocalAccount
+from eth_typing import HexStr
 from eth_typing.evm import ChecksumAddress
+from eth_utils import encode_hex
+from eth_utils import function_abi_to_4byte_selector
+from hexbytes import HexBytes
 from web3 import Web3
+from web3._utils.abi import get_abi_output_types
+from web3._utils.abi import map_abi_data
+from web3._utils.abi import merge_args_and_kwargs
+from web3._utils.contracts import encode_abi
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.transactions import fill_transaction_defaults
+from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+from web3.exceptions import TransactionNotFound
+from web3.exceptions import ValidationError
 
 from telliot_core.model.endpoints import RPCEndpoint
 from telliot_core.utils.key_helpers import lazy_key_getter
@@ -39,6 +61,11 @@ class Contract:
         self.contract = None
         self.account = account
         self._private_key: Optional[bytes] = None
+        self._functions: Dict[str, ContractFunction] = {}
+        self._selectors: Dict[str, HexStr] = {}
+        self._pending_receipts: Dict[
+            HexBytes, asyncio.Task[Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]]
+        ] = {}
 
     def connect(self) -> ResponseStatus:
         """Connect to EVM contract through an RPC Endpoint"""
@@ -49,8 +76,33 @@ class Contract:
 
         self.node.connect()
         self.contract = self.node.web3.eth.contract(address=self.address, abi=self.abi)
+        self._functions = {}
+        self._selectors = {}
         return ResponseStatus(ok=True)
 
+    def get_function(self, func_name: str) -> ContractFunction:
+        """Look up a contract function by name (cached until the next `connect()`)"""
+        assert self.contract is not None
+
+        contract_function = self._functions.get(func_name)
+        if contract_function is None:
+            contract_function = self.contract.get_function_by_name(func_name)
+            self._functions[func_name] = contract_function
+
+        return contract_function
+
+    def encode_call(self, func_name: str, **kwargs: Any) -> HexStr:
+        """Encode the transaction data for a contract function call"""
+        fn_abi = self.get_function(func_name).abi
+
+        selector = self._selectors.get(func_name)
+        if selector is None:
+            selector = encode_hex(function_abi_to_4byte_selector(cast(Dict[str, Any], fn_abi)))
+            self._selectors[func_name] = selector
+
+        args = merge_args_and_kwargs(fn_abi, (), kwargs)
+        return encode_abi(self.node.web3, fn_abi, args, data=selector)
+
     async def read(self, func_name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ResponseStatus]:
         """
         Reads data from contract
@@ -63,7 +115,7 @@ class Contract:
 
         if self.contract:
             try:
-                contract_function = self.contract.get_function_by_name(func_name)
+                contract_function = self.get_function(func_name)
                 output = contract_function(*args, **kwargs).call()
                 return output, ResponseStatus(ok=True)
             except ValueError as e:
@@ -73,6 +125,95 @@ class Contract:
             msg = "no instance of contract"
             return None, ResponseStatus(ok=False, error=msg)
 
+    async def read_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> List[Tuple[Any, ResponseStatus]]:
+        """Read several contract functions in a single JSON-RPC batch request
+
+        Websocket endpoints fall back to sequential reads.
+
+        Args:
+            calls: (function name, function kwargs) pairs
+            session: Optional shared client session (e.g. `TelliotCore.shared_session`)
+
+        Returns:
+            One (output, status) pair per call, in the same order as `calls`
+        """
+
+        if not self.contract:
+            msg = "no instance of contract"
+            return [(None, ResponseStatus(ok=False, error=msg))] * len(calls)
+
+        if not self.node.url.startswith("http"):
+            return [await self.read(func_name, **kwargs) for func_name, kwargs in calls]
+
+        if session is None:
+            async with aiohttp.ClientSession() as s:
+                return await self.read_many(calls, session=s)
+
+        no_response = ResponseStatus(ok=False, error="no response from node")
+        results: List[Tuple[Any, ResponseStatus]] = [(None, no_response)] * len(calls)
+        output_types: Dict[int, List[str]] = {}
+        batch = []
+
+        for i, (func_name, kwargs) in enumerate(calls):
+            try:
+                contract_function = self.get_function(func_name)(**kwargs)
+            except ValueError as e:
+                msg = f"function '{func_name}' not found in contract abi"
+                results[i] = (None, ResponseStatus(ok=False, e=e, error=msg))
+                continue
+            except (TypeError, ValidationError) as e:
+                msg = f"invalid arguments for function '{func_name}'"
+                results[i] = (None, error_status(msg, log=logger.error, e=e))
+                continue
+
+            output_types[i] = get_abi_output_types(contract_function.abi)
+            tx = {"to": self.address, "data": contract_function._encode_transaction_data()}
+            batch.append({"jsonrpc": "2.0", "id": i, "method": "eth_call", "params": [tx, "latest"]})
+
+        if not batch:
+            return results
+
+        try:
+            async with session.post(self.node.url, json=batch) as rsp:
+                responses = await rsp.json(content_type=None)
+        except Exception as e:
+            status = error_status("JSON-RPC batch request failed", log=logger.error, e=e)
+            return [(None, status) if i in output_types else r for i, r in enumerate(results)]
+
+        if not isinstance(responses, list):
+            # Nodes that do not support batching reply with a single error object
+            msg = f"JSON-RPC batch request rejected: {responses}"
+            status = error_status(msg, log=logger.error)
+            return [(None, status) if i in output_types else r for i, r in enumerate(results)]
+
+        for response in responses:
+            i = response.get("id") if isinstance(response, dict) else None
+            if not isinstance(i, int) or i not in output_types:
+                # e.g. an invalid request error, which has a null id
+                logger.error(f"Unmatched JSON-RPC batch response: {response}")
+                continue
+
+            func_name = calls[i][0]
+
+            if "error" in response:
+                msg = f"function '{func_name}' call failed: {response['error']}"
+                results[i] = (None, error_status(msg, log=logger.error))
+                continue
+
+            try:
+                output_data = self.node.web3.codec.decode_abi(output_types[i], HexBytes(response["result"]))
+                output = map_abi_data(BASE_RETURN_NORMALIZERS, output_types[i], output_data)
+                results[i] = (output[0] if len(output) == 1 else output, ResponseStatus(ok=True))
+            except Exception as e:
+                msg = f"Could not decode output of function '{func_name}'"
+                results[i] = (None, error_status(msg, log=logger.error, e=e))
+
+        return results
+
     @property
     def private_key(self) -> bytes:
 
@@ -97,21 +238,101 @@ class Contract:
 
         """
 
-        # Validate inputs
-        if (legacy_gas_price is not None) and ((max_fee_per_gas is not None) or (max_priority_fee_per_gas is not None)):
-            raise ValueError(
-                """invalid combination of legacy gas arguments
-                 and EIP-1559 gas arguments"""
-            )
+        tx_hash, status = self._send_transaction(
+            func_name,
+            gas_limit=gas_limit,
+            legacy_gas_price=legacy_gas_price,
+            max_priority_fee_per_gas=max_priority_fee_per_gas,
+            max_fee_per_gas=max_fee_per_gas,
+            acc_nonce=acc_nonce,
+            **kwargs,
+        )
 
-        if (legacy_gas_price is None) and (max_fee_per_gas is None) and (max_priority_fee_per_gas is None):
-            raise ValueError("no gas strategy selected!")
+        if tx_hash is None:
+            return None, status
 
-        status = ResponseStatus()
+        return await self._confirm_transaction(func_name, tx_hash)
+
+    async def send(
+        self,
+        func_name: str,
+        gas_limit: int,
+        legacy_gas_price: Optional[int] = None,
+        max_priority_fee_per_gas: Optional[int] = None,
+        max_fee_per_gas: Optional[int] = None,
+        acc_nonce: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Tuple[Optional[HexBytes], ResponseStatus]:
+        """Submit a contract transaction without waiting for it to be mined
+
+        The receipt is tracked by a background task that logs the outcome.
+        Successful confirmations are then dropped; failed ones are kept until
+        collected with `Contract.wait_for_pending()`.
+
+        gas price measured in gwei
+
+        Returns:
+            Transaction hash, or None if the transaction could not be sent
+        """
+
+        tx_hash, status = self._send_transaction(
+            func_name,
+            gas_limit=gas_limit,
+            legacy_gas_price=legacy_gas_price,
+            max_priority_fee_per_gas=max_priority_fee_per_gas,
+            max_fee_per_gas=max_fee_per_gas,
+            acc_nonce=acc_nonce,
+            **kwargs,
+        )
+
+        if tx_hash is not None:
+            task = asyncio.create_task(self._confirm_transaction(func_name, tx_hash))
+            task.add_done_callback(functools.partial(self._drop_confirmed, tx_hash))
+            self._pending_receipts[tx_hash] = task
+
+        return tx_hash, status
+
+    async def wait_for_pending(self) -> List[Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]]:
+        """Wait for outstanding `Contract.send()` transactions to be confirmed
+
+        Returns the receipts of transactions still pending, plus failed
+        confirmations not collected yet, in the order they were sent.
+        """
+        tx_hashes = list(self._pending_receipts)
+        receipts = await asyncio.gather(*(self._pending_receipts[tx_hash] for tx_hash in tx_hashes))
+
+        for tx_hash in tx_hashes:
+            self._pending_receipts.pop(tx_hash, None)
+
+        return list(receipts)
+
+    def _drop_confirmed(
+        self,
+        tx_hash: HexBytes,
+        task: asyncio.Task[Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]],
+    ) -> None:
+        """Stop tracking a receipt task once it has confirmed successfully"""
+        if task.cancelled() or task.result()[1].ok:
+            self._pending_receipts.pop(tx_hash, None)
+
+    def _send_transaction(
+        self,
+        func_name: str,
+        gas_limit: int,
+        legacy_gas_price: Optional[int] = None,
+        max_priority_fee_per_gas: Optional[int] = None,
+        max_fee_per_gas: Optional[int] = None,
+        acc_nonce: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Tuple[Optional[HexBytes], ResponseStatus]:
+        """Build, sign and send a contract transaction"""
+
+        # Validate inputs
+        _check_gas_args(legacy_gas_price, max_priority_fee_per_gas, max_fee_per_gas)
 
         if not acc_nonce:
             acc = self.node.web3.eth.account.from_key(self.private_key)
-            acc_nonce = self.node.web3.eth.get_transaction_count(acc.address)
+            acc_nonce = self.node.web3.eth.get_transaction_count(acc.address, "pending")
 
         if not self.contract:
             msg = f"Contract.write({func_name}) error: Unable to connect to contract"
@@ -128,60 +349,16 @@ class Contract:
             return None, error_status(msg, log=logger.error)
 
         try:
-            # build transaction
-            contract_function = self.contract.get_function_by_name(func_name)
-            transaction = contract_function(**kwargs)
-
-            # start tx dict with static elements
-            tx_dict = {
-                "from": acc.address,
-                "nonce": acc_nonce,
-                "gas": gas_limit,
-                "chainId": self.node.chain_id,
-            }
-
-            # use legacy gas strategy if only legacy gas price is provided
-            if legacy_gas_price is not None:
-
-                if (max_fee_per_gas is not None) or (max_priority_fee_per_gas is not None):
-                    raise ValueError(
-                        """"cannot use both legacy gas arguments
-                        and type 2 transaction (EIP1559) args in one transaction"""
-                    )
-
-                tx_dict["gasPrice"] = self.node.web3.toWei(legacy_gas_price, "gwei")
-
-            # use EIP-1559 gas strategy if maxFeePerGas
-            # and/or MaxPriorityFeePerGas are provided
-            else:
-                if legacy_gas_price is not None:
-                    raise ValueError(
-                        """"cannot use both legacy gas arguments
-                         and type 2 transaction (EIP1559) args in one transaction"""
-                    )
-
-                if max_fee_per_gas is not None:
-                    tx_dict["maxFeePerGas"] = self.node.web3.toWei(max_fee_per_gas, "gwei")
-
-                    if max_priority_fee_per_gas is not None:
-                        tx_dict["maxPriorityFeePerGas"] = self.node.web3.toWei(max_priority_fee_per_gas, "gwei")
-
-                    # else if (if legacy price and max fee are not provided)
-                    # use max priority fee
-                    elif max_priority_fee_per_gas is not None:
-                        tx_dict["maxPriorityFeePerGas"] = self.node.web3.toWei(max_priority_fee_per_gas, "gwei")
-
-                    # raise ValueError if no gas arguments are provided
-                    else:
-                        raise ValueError(
-                            """no gas strategy selected!
-                            must provide either legacy
-                            or EIP-1559 gas arguments"""
-                        )
-            # pass in tx dict to build the transaction
-            built_tx = transaction.buildTransaction(tx_dict)
-            # submit transaction
-            tx_signed = acc.sign_transaction(built_tx)
+            tx_signed = self._sign_transaction(
+                acc,
+                func_name,
+                gas_limit=gas_limit,
+                acc_nonce=acc_nonce,
+                legacy_gas_price=legacy_gas_price,
+                max_priority_fee_per_gas=max_priority_fee_per_gas,
+                max_fee_per_gas=max_fee_per_gas,
+                **kwargs,
+            )
 
         except Exception as e:
             note = "Failed to build transaction"
@@ -195,9 +372,171 @@ class Contract:
             note = "Send transaction failed"
             return None, error_status(note, log=logger.error, e=e)
 
+        return tx_hash, ResponseStatus()
+
+    async def write_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        gas_limit: int,
+        legacy_gas_price: Optional[int] = None,
+        max_priority_fee_per_gas: Optional[int] = None,
+        max_fee_per_gas: Optional[int] = None,
+        acc_nonce: Optional[int] = None,
+    ) -> List[Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]]:
+        """Submit several contract transactions in one pass without retries
+
+        All transactions are sent before any receipt is awaited.
+
+        gas price measured in gwei
+
+        Args:
+            calls: (function name, function kwargs) pairs, submitted in order
+            gas_limit: Gas limit used for each transaction
+
+        Returns:
+            One (receipt, status) pair per call, in the same order as `calls`
+        """
+
+        # Validate inputs
+        _check_gas_args(legacy_gas_price, max_priority_fee_per_gas, max_fee_per_gas)
+
+        if not self.contract:
+            msg = "Contract.write_many() error: Unable to connect to contract"
+            return [(None, error_status(msg, log=logger.error))] * len(calls)
+
+        if not self.node:
+            msg = "Contract.write_many() error: No node instance"
+            return [(None, error_status(msg, log=logger.error))] * len(calls)
+
+        if self.private_key:
+            acc = self.node.web3.eth.account.from_key(self.private_key)
+        else:
+            msg = "Contract.write_many() error: Private key missing"
+            return [(None, error_status(msg, log=logger.error))] * len(calls)
+
+        if not acc_nonce:
+            acc_nonce = self.node.web3.eth.get_transaction_count(acc.address, "pending")
+
+        results: List[Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]] = []
+        sent: List[Tuple[int, str, HexBytes]] = []
+
+        for func_name, kwargs in calls:
+            try:
+                tx_signed = self._sign_transaction(
+                    acc,
+                    func_name,
+                    gas_limit=gas_limit,
+                    acc_nonce=acc_nonce,
+                    legacy_gas_price=legacy_gas_price,
+                    max_priority_fee_per_gas=max_priority_fee_per_gas,
+                    max_fee_per_gas=max_fee_per_gas,
+                    **kwargs,
+                )
+            except Exception as e:
+                note = f"Failed to build transaction: {func_name}"
+                results.append((None, error_status(note, log=logger.error, e=e)))
+                continue
+
+            try:
+                logger.debug(f"Sending transaction: {func_name} (nonce={acc_nonce})")
+                tx_hash = self.node.web3.eth.send_raw_transaction(tx_signed.rawTransaction)
+            except Exception as e:
+                note = f"Send transaction failed: {func_name}"
+                results.append((None, error_status(note, log=logger.error, e=e)))
+                continue
+
+            # Only consume the nonce once the transaction is accepted by the node
+            acc_nonce += 1
+            sent.append((len(results), func_name, tx_hash))
+            results.append((None, ResponseStatus()))
+
+        # Wait for all receipts concurrently
+        receipts = await asyncio.gather(
+            *(self._confirm_transaction(func_name, tx_hash) for _, func_name, tx_hash in sent)
+        )
+        for (idx, _, _), receipt in zip(sent, receipts):
+            results[idx] = receipt
+
+        return results
+
+    def _sign_transaction(
+        self,
+        acc: LocalAccount,
+        func_name: str,
+        gas_limit: int,
+        acc_nonce: int,
+        legacy_gas_price: Optional[int] = None,
+        max_priority_fee_per_gas: Optional[int] = None,
+        max_fee_per_gas: Optional[int] = None,
+        **kwargs: Any,
+    ) -> SignedTransaction:
+        """Build and sign a contract transaction"""
+
+        assert self.contract is not None
+
+        # start tx dict with static elements
+        tx_dict = {
+            "to": self.address,
+            "data": self.encode_call(func_name, **kwargs),
+            "from": acc.address,
+            "nonce": acc_nonce,
+            "gas": gas_limit,
+            "chainId": self.node.chain_id,
+        }
+
+        # use legacy gas strategy if only legacy gas price is provided
+        if legacy_gas_price is not None:
+
+            if (max_fee_per_gas is not None) or (max_priority_fee_per_gas is not None):
+                raise ValueError(
+                    """"cannot use both legacy gas arguments
+                    and type 2 transaction (EIP1559) args in one transaction"""
+                )
+
+            tx_dict["gasPrice"] = self.node.web3.toWei(legacy_gas_price, "gwei")
+
+        # use EIP-1559 gas strategy if maxFeePerGas
+        # and/or MaxPriorityFeePerGas are provided
+        else:
+            if legacy_gas_price is not None:
+                raise ValueError(
+                    """"cannot use both legacy gas arguments
+                     and type 2 transaction (EIP1559) args in one transaction"""
+                )
+
+            if max_fee_per_gas is not None:
+                tx_dict["maxFeePerGas"] = self.node.web3.toWei(max_fee_per_gas, "gwei")
+
+                if max_priority_fee_per_gas is not None:
+                    tx_dict["maxPriorityFeePerGas"] = self.node.web3.toWei(max_priority_fee_per_gas, "gwei")
+
+                # else if (if legacy price and max fee are not provided)
+                # use max priority fee
+                elif max_priority_fee_per_gas is not None:
+                    tx_dict["maxPriorityFeePerGas"] = self.node.web3.toWei(max_priority_fee_per_gas, "gwei")
+
+                # raise ValueError if no gas arguments are provided
+                else:
+                    raise ValueError(
+                        """no gas strategy selected!
+                        must provide either legacy
+                        or EIP-1559 gas arguments"""
+                    )
+        # fill in remaining defaults (value, EIP-1559 fees)
+        built_tx = fill_transaction_defaults(self.node.web3, tx_dict)
+        # submit transaction
+        return acc.sign_transaction(built_tx)
+
+    async def _confirm_transaction(
+        self, func_name: str, tx_hash: HexBytes
+    ) -> Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]:
+        """Wait for a transaction receipt and check its status"""
+
+        status = ResponseStatus()
+
         try:
             # Confirm transaction
-            tx_receipt = self.node.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=360)
+            tx_receipt = await self._wait_for_receipt(tx_hash, timeout=360)
 
             tx_url = f"{self.node.explorer}/tx/{tx_hash.hex()}"
 
@@ -214,3 +553,50 @@ class Contract:
         except Exception as e:
             note = "Failed to confirm transaction"
             return None, error_status(note, log=logger.error, e=e)
+
+    async def _wait_for_receipt(
+        self,
+        tx_hash: HexBytes,
+        timeout: float = 360,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 8.0,
+    ) -> AttributeDict[Any, Any]:
+        """Poll for a transaction receipt with exponential backoff"""
+
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                if self.node.url.startswith("http"):
+                    receipt = await asyncio.to_thread(self.node.web3.eth.get_transaction_receipt, tx_hash)
+                else:
+                    # Websocket providers share a single connection that cannot serve
+                    # overlapping requests, so never call them from another thread
+                    receipt = self.node.web3.eth.get_transaction_receipt(tx_hash)
+                return cast(AttributeDict[Any, Any], receipt)
+            except TransactionNotFound:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeExhausted(f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds")
+
+            await asyncio.sleep(min(poll_interval, remaining))
+            poll_interval = min(2 * poll_interval, max_poll_interval)
+
+
+def _check_gas_args(
+    legacy_gas_price: Optional[int],
+    max_priority_fee_per_gas: Optional[int],
+    max_fee_per_gas: Optional[int],
+) -> None:
+    """Raise ValueError unless exactly one gas strategy is selected"""
+
+    if (legacy_gas_price is not None) and ((max_fee_per_gas is not None) or (max_priority_fee_per_gas is not None)):
+        raise ValueError(
+            """invalid combination of legacy gas arguments
+             and EIP-1559 gas arguments"""
+        )
+
+    if (legacy_gas_price is None) and (max_fee_per_gas is None) and (max_priority_fee_per_gas is None):
+        raise ValueError("no gas strategy selected!")
@@ -1,6 +1,7 @@
 """ telliot_core.datafeed.data_source
 
 """
+import asyncio
 import random
 from collections import deque
 from dataclasses import dataclass
@@ -8,6 +9,7 @@ from dataclasses import field
 from typing import Deque
 from typing import Generic
 from typing import List
+from typing import Sequence
 from typing import TypeVar
 
 from telliot_core.dtypes.datapoint import DataPoint
@@ -64,6 +66,31 @@ class DataSource(Generic[T], Base):
         return len(self._history)
 
 
+async def fetch_new_datapoints(
+    sources: Sequence[DataSource[T]],
+    max_workers: int = 10,
+) -> List[OptionalDataPoint[T]]:
+    """Fetch a new datapoint from each source concurrently
+
+    Args:
+        sources: Data sources to fetch from
+        max_workers: Maximum number of concurrent fetches
+
+    Returns:
+        One datapoint per source, in the same order as `sources`
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch(source: DataSource[T]) -> OptionalDataPoint[T]:
+        async with semaphore:
+            return await source.fetch_new_datapoint()
+
+    return list(await asyncio.gather(*(fetch(s) for s in sources)))
+
+
 @dataclass
 class RandomSource(DataSource[float]):
     """A random data source
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
 
+from eth_abi.exceptions import ValueOutOfBounds
+
 from telliot_core.dtypes.value_type import ValueType
 
 
@@ -41,10 +43,18 @@ class UnsignedFloatType(ValueType):
         This encoder converts a float value to the SpotPrice ABI
         data type.
         """
+        decimals = self.decimals
+        nbits = self.nbits
+
+        decimal_value = Decimal(value).quantize(Decimal(10) ** -decimals)
+        int_value = int(decimal_value.scaleb(decimals))
+
+        if not 0 <= int_value < 2**nbits:
+            raise ValueOutOfBounds(f"Value {value} cannot be encoded as {self.abi_type}")
 
-        decimal_value = Decimal(value).quantize(Decimal(10) ** -self.decimals)
+        nbytes = nbits // 8 if self.packed else 32
 
-        return super().encode(decimal_value)
+        return int_value.to_bytes(nbytes, "big", signed=False)
 
     def decode(self, bytes_val: bytes) -> Any:
         """A decoder for float values
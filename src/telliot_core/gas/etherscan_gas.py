@@ -1,7 +1,9 @@
 import json
 import logging
 from dataclasses import dataclass
+from dataclasses import field
 from typing import List
+from typing import Optional
 
 import requests
 from requests import JSONDecodeError
@@ -39,6 +41,16 @@ class EtherscanGasPriceSource(DataSource[EtherscanGasPrice]):
     # Use an API key if higher rate limit is required
     api_key: str = ""
 
+    # Private HTTP session, reused across fetches to keep connections alive
+    _session: Optional[requests.Session] = field(default=None, init=False, repr=False, compare=False)
+
+    def _get_session(self) -> requests.Session:
+        """Get or create the HTTP session"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.mount("https://", adapter)
+        return self._session
+
     async def fetch_new_datapoint(self) -> OptionalDataPoint[EtherscanGasPrice]:
         """Fetch new value and store it for later retrieval"""
 
@@ -48,39 +60,38 @@ class EtherscanGasPriceSource(DataSource[EtherscanGasPrice]):
         if self.api_key:
             msg = msg + f"&apikey={self.api_key}"
 
-        with requests.Session() as s:
-            s.mount("https://", adapter)
-
-            try:
-                rsp = s.get(msg, headers=headers)
-            except requests.exceptions.ConnectTimeout as e:
-                logger.error(f"Connection timeout: {e}")
-                return None, None
-
-            try:
-                response = json.loads(rsp.content)
-            except JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                return None, None
-
-            try:
-                status = response["status"]
-            except KeyError as e:
-                logger.error(f"Key error: {e}")
-                return None, None
-
-            if int(status) == 1:
-                gp_result = response["result"]
-                gas_used_ratio_str = gp_result["gasUsedRatio"]
-                gas_used_ratio = [float(num) for num in gas_used_ratio_str.split(",")]
-                gp = EtherscanGasPrice(
-                    LastBlock=int(gp_result["LastBlock"]),
-                    SafeGasPrice=float(gp_result["SafeGasPrice"]),
-                    ProposeGasPrice=float(gp_result["ProposeGasPrice"]),
-                    FastGasPrice=float(gp_result["FastGasPrice"]),
-                    suggestBaseFee=float(gp_result["suggestBaseFee"]),
-                    gasUsedRatio=gas_used_ratio,
-                )
-                return gp, now()
-            else:
-                return None, None
+        s = self._get_session()
+
+        try:
+            rsp = s.get(msg, headers=headers)
+        except requests.exceptions.ConnectTimeout as e:
+            logger.error(f"Connection timeout: {e}")
+            return None, None
+
+        try:
+            response = json.loads(rsp.content)
+        except JSONDecodeError as e:
+            logger.error(f"JSON decode error: {e}")
+            return None, None
+
+        try:
+            status = response["status"]
+        except KeyError as e:
+            logger.error(f"Key error: {e}")
+            return None, None
+
+        if int(status) == 1:
+            gp_result = response["result"]
+            gas_used_ratio_str = gp_result["gasUsedRatio"]
+            gas_used_ratio = [float(num) for num in gas_used_ratio_str.split(",")]
+            gp = EtherscanGasPrice(
+                LastBlock=int(gp_result["LastBlock"]),
+                SafeGasPrice=float(gp_result["SafeGasPrice"]),
+                ProposeGasPrice=float(gp_result["ProposeGasPrice"]),
+                FastGasPrice=float(gp_result["FastGasPrice"]),
+                suggestBaseFee=float(gp_result["suggestBaseFee"]),
+                gasUsedRatio=gas_used_ratio,
+            )
+            return gp, now()
+        else:
+            return None, None
@@ -1,32 +1,81 @@
 import json
 import logging
+import time
 from json.decoder import JSONDecodeError
+from typing import Dict
 from typing import Literal
 from typing import Optional
+from typing import Tuple
 
-import requests
+import aiohttp
 
 logger = logging.getLogger(__name__)
 ethgastypes = Literal["fast", "fastest", "safeLow", "average"]
 
+ETHGASSTATION_URL = "https://ethgasstation.info/json/ethgasAPI.json"
 
-async def fetch_gas_price() -> Optional[int]:
+# Most recent successful ethgasstation fetch for each style: (monotonic time, gwei)
+_gas_price_cache: Dict[str, Tuple[float, int]] = {}
+
+
+async def fetch_gas_price(session: Optional[aiohttp.ClientSession] = None) -> Optional[int]:
     """Estimate current ETH gas price
 
     Current implementation fetches from ethgasstation
 
+    Args:
+        session: Optional shared client session (e.g. `TelliotCore.shared_session`).
+            If omitted, a new session is opened and closed for this call.
+
     Returns:
         eth gas price in gwei
     """
-    return await ethgasstation("fast")
+    return await ethgasstation("fast", session=session)
+
+
+async def ethgasstation(
+    style: ethgastypes = "fast",
+    retries: int = 2,
+    session: Optional[aiohttp.ClientSession] = None,
+    max_age: float = 10.0,
+) -> Optional[int]:
+    """Fetch gas price from ethgasstation in gwei
+
+    Successful results are reused for `max_age` seconds; failures are not cached.
+
+    If no session is provided, a temporary one is opened for this call.
+    Pass a long-lived session to reuse pooled connections between calls.
+    """
+    cached = _gas_price_cache.get(style)
+    if cached is not None:
+        fetched_at, cached_price = cached
+        if time.monotonic() - fetched_at < max_age:
+            return cached_price
+
+    gas_price = await _fetch_ethgasstation(style, retries=retries, session=session)
+
+    if gas_price is None:
+        _gas_price_cache.pop(style, None)
+    else:
+        _gas_price_cache[style] = (time.monotonic(), gas_price)
+
+    return gas_price
+
 
+async def _fetch_ethgasstation(
+    style: ethgastypes,
+    retries: int,
+    session: Optional[aiohttp.ClientSession],
+) -> Optional[int]:
+    """Request the current gas price from the ethgasstation API"""
+    if session is None:
+        async with aiohttp.ClientSession() as s:
+            return await _fetch_ethgasstation(style, retries=retries, session=s)
 
-async def ethgasstation(style: ethgastypes = "fast", retries: int = 2) -> Optional[int]:
-    """Fetch gas price from ethgasstation in gwei"""
     for _ in range(retries):
         try:
-            rsp = requests.get("https://ethgasstation.info/json/ethgasAPI.json")
-            prices = json.loads(rsp.content)
+            async with session.get(ETHGASSTATION_URL) as rsp:
+                prices = json.loads(await rsp.text())
             gas_price = int(prices[style])
             return int(gas_price / 10)  # json output is gwei*10
         except JSONDecodeError:
@@ -2,6 +2,7 @@ from abc import ABC
 from abc import abstractmethod
 from typing import Any
 from typing import Dict
+from typing import Optional
 
 import requests
 
@@ -37,12 +38,21 @@ class PriceServiceInterface(ABC):
 class WebPriceService(PriceServiceInterface, ABC):
     """Abstract Base CLass for a Web-based Pricing Service"""
 
+    # Private HTTP session, reused across requests to keep connections alive
+    _session: Optional[requests.Session] = None
+
     def __init__(self, name: str, url: str, timeout: float = 5.0):
 
         self.name = name
         self.url = url
         self.timeout = timeout
 
+    def _get_session(self) -> requests.Session:
+        """Get or create the HTTP session"""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
     def get_url(self, url: str = "") -> Dict[str, Any]:
         """Helper function to get URL JSON response while handling exceptions
 
@@ -57,15 +67,15 @@ class WebPriceService(PriceServiceInterface, ABC):
         """
 
         request_url = self.url + url
+        s = self._get_session()
 
-        with requests.Session() as s:
-            try:
-                r = s.get(request_url, timeout=self.timeout)
-                json_data = r.json()
-                return {"response": json_data}
+        try:
+            r = s.get(request_url, timeout=self.timeout)
+            json_data = r.json()
+            return {"response": json_data}
 
-            except requests.exceptions.ConnectTimeout as e:
-                return {"error": "Timeout Error", "exception": e}
+        except requests.exceptions.ConnectTimeout as e:
+            return {"error": "Timeout Error", "exception": e}
 
-            except Exception as e:
-                return {"error": str(type(e)), "exception": e}
+        except Exception as e:
+            return {"error": str(type(e)), "exception": e}
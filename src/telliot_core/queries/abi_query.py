@@ -1,6 +1,16 @@
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any
 from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
 
-from clamfig import deserialize
+from clamfig.base import instance
 from clamfig.base import Registry
 from eth_abi import decode_abi
 from eth_abi import encode_abi
@@ -31,23 +41,76 @@ class AbiQuery(OracleQuery):
 
         This method uses ABI encoding to encode the query's parameter values.
         """
-        param_values = [getattr(self, p["name"]) for p in self.abi]
-        param_types = [p["type"] for p in self.abi]
-        encoded_params = encode_abi(param_types, param_values)
+        param_names, param_types = _param_signature(type(self))
+        param_values = tuple(getattr(self, name) for name in param_names)
 
-        return encode_abi(["string", "bytes"], [type(self).__name__, encoded_params])
+        # Equal values of different types (e.g. True and 1) must not share a cache entry
+        value_types = tuple(type(v) for v in param_values)
+
+        try:
+            hash(param_values)
+        except TypeError:
+            # Unhashable parameter values (e.g. lists) cannot be memoized
+            return _encode_query_data.__wrapped__(type(self).__name__, param_types, param_values, value_types)
+
+        return _encode_query_data(type(self).__name__, param_types, param_values, value_types)
 
     @staticmethod
     def get_query_from_data(query_data: bytes) -> OracleQuery:
         """Recreate an oracle query from the `query_data` field"""
 
-        query_type, encoded_param_values = decode_abi(["string", "bytes"], query_data)
-        cls = Registry.registry[query_type]
-        params_abi = cls.abi
-        param_names = [p["name"] for p in params_abi]
-        param_types = [p["type"] for p in params_abi]
-        param_values = decode_abi(param_types, encoded_param_values)
+        return AbiQuery.get_queries_from_data([query_data])[0]
+
+    @staticmethod
+    def get_queries_from_data(query_data: Sequence[bytes]) -> List[OracleQuery]:
+        """Recreate oracle queries from a list of `query_data` fields"""
+
+        decoded = [decode_abi(["string", "bytes"], qd) for qd in query_data]
+
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for i, (query_type, _) in enumerate(decoded):
+            # Decoded strings are new objects; interning lets the registry lookup
+            # below match the (interned) class name by identity
+            groups[sys.intern(query_type)].append(i)
+
+        queries: List[Optional[OracleQuery]] = [None] * len(decoded)
+
+        for query_type, indices in groups.items():
+            cls = Registry.registry[query_type]
+            param_names, param_types = _param_signature(cls)
+
+            for i in indices:
+                param_values = decode_abi(param_types, decoded[i][1])
+                params = dict(zip(param_names, param_values))
+                queries[i] = instance(cls, {"type": query_type, **params})
 
-        params = dict(zip(param_names, param_values))
+        return queries  # type: ignore
+
+
+# Parameter names and ABI types of each query class, unpacked on first use
+_param_signatures: Dict[Type[AbiQuery], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+
+def _param_signature(cls: Type[AbiQuery]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Parameter names and ABI types of a query class."""
+    signature = _param_signatures.get(cls)
+    if signature is None:
+        signature = tuple(p["name"] for p in cls.abi), tuple(p["type"] for p in cls.abi)
+        _param_signatures[cls] = signature
+    return signature
+
+
+@lru_cache(maxsize=256)
+def _encode_query_data(
+    query_type: str,
+    param_types: Tuple[str, ...],
+    param_values: Tuple[Any, ...],
+    value_types: Tuple[type, ...],
+) -> bytes:
+    """ABI-encode the query type and parameters.
+
+    `value_types` is only used as part of the cache key.
+    """
+    encoded_params = encode_abi(param_types, param_values)
 
-        return deserialize({"type": query_type, **params})  # type: ignore
+    return encode_abi(["string", "bytes"], [query_type, encoded_params])
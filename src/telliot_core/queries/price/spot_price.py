@@ -4,6 +4,9 @@
 import json
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+from typing import FrozenSet
 from typing import List
 from typing import Tuple
 
@@ -32,7 +35,23 @@ def get_spot_price_pairs() -> List[Tuple[str, str]]:
     return pairs
 
 
-spot_price_pairs = get_spot_price_pairs()
+@lru_cache(maxsize=1)
+def _load_spot_price_pairs() -> Tuple[Tuple[str, str], ...]:
+    """Read the valid spot price pairs once, on first use"""
+    return tuple(get_spot_price_pairs())
+
+
+@lru_cache(maxsize=1)
+def _supported_spot_price_pairs() -> FrozenSet[Tuple[str, str]]:
+    """Valid spot price pairs, for fast membership checks"""
+    return frozenset(_load_spot_price_pairs())
+
+
+def __getattr__(name: str) -> Any:
+    # Load `spot_price_pairs` lazily so importing this module does not read from disk
+    if name == "spot_price_pairs":
+        return list(_load_spot_price_pairs())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -70,5 +89,5 @@ class SpotPrice(AbiQuery):
         if self.currency not in currencies:
             raise ValueError(f"currency {self.currency} not supported")
 
-        if (self.asset, self.currency) not in spot_price_pairs:
+        if (self.asset, self.currency) not in _supported_spot_price_pairs():
             raise ValueError(f"{self.asset}/{self.currency} is not a supported pair")
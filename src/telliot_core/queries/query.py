@@ -6,6 +6,7 @@ from __future__ import annotations
 import json
 from typing import Any
 from typing import Dict
+from typing import Optional
 
 from clamfig import deserialize
 from clamfig import Serializable
@@ -64,11 +65,20 @@ class OracleQuery(Serializable):
         The Query descriptor is a unique string representation of the query, including
         all parameter values.  The string must be in valid JSON format (http://www.json.org).
 
+        The descriptor is cached until a query parameter is changed.
         """
-        state = self.get_state()
-        json_str = json.dumps(state, separators=(",", ":"))
+        json_str: Optional[str] = self.__dict__.get("_descriptor")
+        if json_str is None:
+            state = self.get_state()
+            json_str = json.dumps(state, separators=(",", ":"))
+            self.__dict__["_descriptor"] = json_str
         return json_str
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any change to the query parameters invalidates the cached descriptor
+        self.__dict__.pop("_descriptor", None)
+        super().__setattr__(name, value)
+
     @property
     def query_id(self) -> bytes:
         """Returns the query ``id`` for use with the
@@ -0,0 +1,81 @@
+"""Helpers for running periodic async tasks"""
+import asyncio
+import time
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def ticker(interval: float) -> AsyncIterator[float]:
+    """Yield at a fixed cadence without cumulative drift
+
+    Ticks are scheduled relative to the first one.  Ticks missed while
+    handling an earlier tick are skipped.
+
+    Args:
+        interval: Seconds between ticks
+
+    Yields:
+        Monotonic time at which each tick was scheduled
+    """
+    if interval <= 0:
+        raise ValueError(f"interval must be positive, got {interval}")
+
+    next_tick = time.monotonic()
+
+    while True:
+        yield next_tick
+
+        next_tick += interval
+        now = time.monotonic()
+        if next_tick < now:
+            next_tick += ((now - next_tick) // interval + 1) * interval
+
+        await asyncio.sleep(next_tick - now)
+
+
+async def pipeline(
+    produce: Callable[[], Awaitable[T]],
+    consume: Callable[[T], Awaitable[None]],
+    interval: float,
+) -> None:
+    """Run a periodic producer and its consumer concurrently
+
+    `produce` is called once per `ticker` interval, overlapping with `consume`
+    handling the previous result.  A result that has not been picked up by
+    the time the next one is produced is replaced, so `consume` always gets
+    the newest result.
+
+    Runs until cancelled, or until `produce` or `consume` raises.  Both
+    tasks are cancelled and awaited before returning.
+
+    Args:
+        produce: Coroutine function returning the next item
+        consume: Coroutine function handling one item
+        interval: Seconds between calls to `produce`
+    """
+    queue: "asyncio.Queue[T]" = asyncio.Queue(maxsize=1)
+
+    async def producer() -> None:
+        async for _ in ticker(interval):
+            item = await produce()
+            if queue.full():
+                queue.get_nowait()  # drop the stale result
+            queue.put_nowait(item)
+
+    async def consumer() -> None:
+        while True:
+            item = await queue.get()
+            await consume(item)
+
+    tasks = [asyncio.create_task(producer()), asyncio.create_task(consumer())]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancellations so no task outlives the pipeline
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,5 +1,10 @@
+import pytest
+from eth_abi.exceptions import EncodingTypeError
+
+from telliot_core.queries.abi_query import _encode_query_data
 from telliot_core.queries.abi_query import AbiQuery
 from telliot_core.queries.morphware import Morphware
+from telliot_core.queries.price.spot_price import SpotPrice
 
 
 def test_query_data():
@@ -34,3 +39,26 @@ def test_get_query_from_data():
 
     assert isinstance(q, Morphware)
     assert q.version == 1
+
+
+def test_query_data_cache():
+    q = Morphware(version=1)
+    query_data = q.query_data
+
+    hits = _encode_query_data.cache_info().hits
+    assert Morphware(version=1).query_data == query_data
+    assert _encode_query_data.cache_info().hits == hits + 1
+
+    assert Morphware(version=2).query_data != query_data
+
+    # A cached int encoding must not be reused for an equal bool
+    with pytest.raises(EncodingTypeError):
+        Morphware(version=True).query_data
+
+
+def test_get_queries_from_data():
+    queries = [Morphware(version=1), SpotPrice(asset="btc", currency="usd"), Morphware(version=2)]
+
+    decoded = AbiQuery.get_queries_from_data([q.query_data for q in queries])
+
+    assert decoded == queries
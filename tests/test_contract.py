@@ -1,10 +1,20 @@
 """
 Test covering Pytelliot EVM contract connection utils.
 """
+import asyncio
+import threading
+from unittest import mock
+
 import pytest
 import web3
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+from web3.exceptions import TransactionNotFound
 
 from telliot_core.apps.core import TelliotCore
+from telliot_core.contract.contract import Contract
+from telliot_core.model.endpoints import RPCEndpoint
+from telliot_core.utils.response import ResponseStatus
 
 
 @pytest.mark.asyncio
@@ -38,3 +48,265 @@ async def test_mixed_gas_inputs(rinkeby_test_cfg):
                 legacy_gas_price=1,
                 max_fee_per_gas=2,
             )
+
+
+def make_contract(abi=(), url="http://127.0.0.1:8545", mock_web3=False):
+    """Contract on an unconnected local endpoint, with a real or mocked web3"""
+    node = RPCEndpoint(chain_id=1, url=url)
+    node._web3 = mock.MagicMock() if mock_web3 else web3.Web3(web3.Web3.HTTPProvider(node.url))
+    contract = Contract(address="0x" + "11" * 20, abi=list(abi), node=node)
+    contract.contract = node.web3.eth.contract(address=contract.address, abi=contract.abi)
+    return contract
+
+
+@pytest.mark.asyncio
+async def test_wait_for_receipt():
+    """Receipts are polled until found, or until the timeout expires"""
+    contract = make_contract(mock_web3=True)
+    node = contract.node
+    tx_hash = HexBytes("0x" + "22" * 32)
+
+    node.web3.eth.get_transaction_receipt.side_effect = [TransactionNotFound("pending"), {"status": 1}]
+    receipt = await contract._wait_for_receipt(tx_hash, poll_interval=0.01)
+    assert receipt == {"status": 1}
+    assert node.web3.eth.get_transaction_receipt.call_count == 2
+
+    node.web3.eth.get_transaction_receipt.side_effect = TransactionNotFound("pending")
+    with pytest.raises(TimeExhausted):
+        await contract._wait_for_receipt(tx_hash, timeout=0.05, poll_interval=0.01)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url, threaded", [("http://127.0.0.1:8545", True), ("wss://127.0.0.1:8546", False)])
+async def test_wait_for_receipt_threads(url, threaded):
+    """Receipts are only polled from a worker thread for HTTP endpoints"""
+    contract = make_contract(url=url, mock_web3=True)
+    threads = []
+
+    def get_transaction_receipt(tx_hash):
+        threads.append(threading.get_ident())
+        return {"status": 1}
+
+    contract.node.web3.eth.get_transaction_receipt.side_effect = get_transaction_receipt
+    await contract._wait_for_receipt(HexBytes("0x" + "22" * 32))
+
+    assert (threads[0] != threading.get_ident()) == threaded
+
+
+def test_get_function_cached():
+    """Contract function lookups are cached until the next connect()"""
+    abi = [
+        {
+            "name": "getTimeBasedReward",
+            "type": "function",
+            "inputs": [],
+            "outputs": [{"name": "", "type": "uint256"}],
+            "stateMutability": "view",
+        }
+    ]
+    contract = make_contract(abi)
+
+    func = contract.get_function("getTimeBasedReward")
+    assert contract.get_function("getTimeBasedReward") is func
+
+    with pytest.raises(ValueError):
+        contract.get_function("missing")
+
+
+def test_encode_call():
+    """Transaction data matches web3 encoding and the selector is cached"""
+    abi = [
+        {
+            "name": "submitValue",
+            "type": "function",
+            "inputs": [
+                {"name": "_queryId", "type": "bytes32"},
+                {"name": "_value", "type": "bytes"},
+                {"name": "_nonce", "type": "uint256"},
+                {"name": "_queryData", "type": "bytes"},
+            ],
+            "outputs": [],
+            "stateMutability": "nonpayable",
+        }
+    ]
+    contract = make_contract(abi)
+
+    kwargs = dict(_queryData=b"query", _nonce=3, _value=b"\x01" * 32, _queryId=b"\x02" * 32)
+    expected = contract.contract.encodeABI(fn_name="submitValue", kwargs=kwargs)
+
+    assert contract.encode_call("submitValue", **kwargs) == expected
+    assert contract._selectors["submitValue"] == expected[:10]
+    assert contract.encode_call("submitValue", **kwargs) == expected
+
+
+@pytest.mark.asyncio
+async def test_read_many():
+    """Batched reads report each call's result or error in order"""
+    abi = [
+        {
+            "name": "getUint",
+            "type": "function",
+            "inputs": [{"name": "_x", "type": "uint256"}],
+            "outputs": [{"name": "", "type": "uint256"}],
+            "stateMutability": "view",
+        }
+    ]
+    contract = make_contract(abi)
+
+    calls = [
+        ("getUint", {"_x": 1}),
+        ("getUint", {"_x": 2}),
+        ("getUint", {"_x": 3}),
+        ("missing", {}),
+        ("getUint", {"_y": 1}),
+    ]
+
+    session = mock.MagicMock()
+    rsp = session.post.return_value.__aenter__.return_value
+    rsp.json = mock.AsyncMock(
+        return_value=[
+            {"jsonrpc": "2.0", "id": 0, "result": "0x" + "00" * 31 + "05"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "execution reverted"}},
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "invalid request"}},
+            {"jsonrpc": "2.0", "id": 99, "result": "0x"},
+        ]
+    )
+
+    results = await contract.read_many(calls, session=session)
+    batch = session.post.call_args.kwargs["json"]
+    assert [req["id"] for req in batch] == [0, 1, 2]
+
+    assert results[0][0] == 5
+    assert results[0][1].ok
+    assert [status.ok for _, status in results[1:]] == [False] * 4
+    assert "execution reverted" in results[1][1].error
+    assert results[2][1].error == "no response from node"
+    assert "not found" in results[3][1].error
+    assert "invalid arguments" in results[4][1].error
+
+    # Nodes without batch support reply with a single error object
+    rsp.json.return_value = {"jsonrpc": "2.0", "id": None, "error": {"message": "batch not supported"}}
+    results = await contract.read_many(calls, session=session)
+    assert [status.ok for _, status in results] == [False] * 5
+    assert "batch not supported" in results[0][1].error
+
+
+def mock_write_contract(url="http://127.0.0.1:8545"):
+    """Contract with a mocked node and signer, for testing the write path offline"""
+    contract = make_contract(url=url, mock_web3=True)
+    contract.node.web3.eth.get_transaction_count.return_value = 7
+    contract.node.web3.eth.send_raw_transaction.side_effect = lambda raw: HexBytes(raw)
+    contract._private_key = b"\x01" * 32
+
+    def sign_transaction(acc, func_name, gas_limit, acc_nonce, **kwargs):
+        if func_name == "bad_build":
+            raise ValueError("cannot build")
+        signed = mock.MagicMock()
+        signed.rawTransaction = f"{func_name}:{acc_nonce}".encode()
+        return signed
+
+    async def confirm_transaction(func_name, tx_hash):
+        return {"transactionHash": tx_hash}, ResponseStatus()
+
+    contract._sign_transaction = mock.MagicMock(side_effect=sign_transaction)
+    contract._confirm_transaction = mock.AsyncMock(side_effect=confirm_transaction)
+    return contract
+
+
+@pytest.mark.asyncio
+async def test_write_many():
+    """Nonces are only consumed by sent transactions and results keep call order"""
+    contract = mock_write_contract()
+    eth = contract.node.web3.eth
+
+    def send_raw_transaction(raw):
+        if raw.startswith(b"bad_send"):
+            raise ValueError("rejected")
+        return HexBytes(raw)
+
+    eth.send_raw_transaction.side_effect = send_raw_transaction
+
+    calls = [("a", {}), ("bad_build", {}), ("b", {}), ("bad_send", {}), ("c", {"_x": 1})]
+    results = await contract.write_many(calls, gas_limit=350000, legacy_gas_price=1)
+
+    eth.get_transaction_count.assert_called_once()
+    assert eth.get_transaction_count.call_args.args[1] == "pending"
+    nonces = [(c.args[1], c.kwargs["acc_nonce"]) for c in contract._sign_transaction.call_args_list]
+    assert nonces == [("a", 7), ("bad_build", 8), ("b", 8), ("bad_send", 9), ("c", 9)]
+    assert contract._sign_transaction.call_args_list[-1].kwargs["_x"] == 1
+
+    assert len(results) == len(calls)
+    receipts = [receipt and receipt["transactionHash"] for receipt, _ in results]
+    assert receipts == [HexBytes(b"a:7"), None, HexBytes(b"b:8"), None, HexBytes(b"c:9")]
+    assert [status.ok for _, status in results] == [True, False, True, False, True]
+    assert "Failed to build transaction: bad_build" in results[1][1].error
+    assert "Send transaction failed: bad_send" in results[3][1].error
+
+
+@pytest.mark.asyncio
+async def test_write_many_websocket_receipts():
+    """On websocket endpoints, concurrent confirmations never call the provider from other threads"""
+    contract = mock_write_contract(url="wss://127.0.0.1:8546")
+    del contract._confirm_transaction  # use the real confirmation
+    threads = []
+
+    def get_transaction_receipt(tx_hash):
+        threads.append(threading.get_ident())
+        return {"status": 1, "transactionHash": tx_hash}
+
+    contract.node.web3.eth.get_transaction_receipt.side_effect = get_transaction_receipt
+    results = await contract.write_many([("a", {}), ("b", {}), ("c", {})], gas_limit=350000, legacy_gas_price=1)
+
+    assert [status.ok for _, status in results] == [True] * 3
+    assert threads == [threading.get_ident()] * 3
+
+
+@pytest.mark.asyncio
+async def test_write_many_nonce_override():
+    """A provided nonce is used as the starting nonce without querying the node"""
+    contract = mock_write_contract()
+
+    results = await contract.write_many([("a", {}), ("b", {})], gas_limit=350000, legacy_gas_price=1, acc_nonce=3)
+
+    contract.node.web3.eth.get_transaction_count.assert_not_called()
+    assert [receipt["transactionHash"] for receipt, _ in results] == [HexBytes(b"a:3"), HexBytes(b"b:4")]
+
+
+@pytest.mark.asyncio
+async def test_send_and_wait_for_pending():
+    """Confirmed sends are dropped once they land; failures are kept until collected"""
+    contract = mock_write_contract()
+
+    async def confirm_transaction(func_name, tx_hash):
+        if func_name == "b":
+            return None, ResponseStatus(ok=False, error="reverted")
+        return {"transactionHash": tx_hash}, ResponseStatus()
+
+    contract._confirm_transaction.side_effect = confirm_transaction
+
+    tx_a, status = await contract.send("a", gas_limit=350000, legacy_gas_price=1, acc_nonce=1)
+    assert status.ok
+    tx_b, _ = await contract.send("b", gas_limit=350000, legacy_gas_price=1, acc_nonce=2)
+    tx_none, status = await contract.send("bad_build", gas_limit=350000, legacy_gas_price=1, acc_nonce=3)
+    assert tx_none is None
+    assert not status.ok
+
+    # Unconfirmed transactions count towards the next nonce
+    contract.node.web3.eth.get_transaction_count.return_value = 4
+    tx_c, _ = await contract.send("c", gas_limit=350000, legacy_gas_price=1)
+    assert contract.node.web3.eth.get_transaction_count.call_args.args[1] == "pending"
+    assert tx_c == HexBytes(b"c:4")
+
+    # Let the background confirmations finish
+    await asyncio.gather(*list(contract._pending_receipts.values()))
+    await asyncio.sleep(0)
+    assert list(contract._pending_receipts) == [tx_b]
+
+    receipts = await contract.wait_for_pending()
+    assert [status.error for _, status in receipts] == ["reverted"]
+    assert await contract.wait_for_pending() == []
+
+    # Receipts still being confirmed are collected too
+    tx_d, _ = await contract.send("d", gas_limit=350000, legacy_gas_price=1, acc_nonce=5)
+    receipts = await contract.wait_for_pending()
+    assert [receipt["transactionHash"] for receipt, _ in receipts] == [tx_d]
@@ -5,6 +5,7 @@ from datetime import datetime
 
 import pytest
 
+from telliot_core.datasource import fetch_new_datapoints
 from telliot_core.datasource import RandomSource
 
 
@@ -26,3 +27,20 @@ async def test_random_source():
 
     latest_values = s.get_all_datapoints()
     assert len(latest_values) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_new_datapoints():
+    """Test fetching from several sources concurrently"""
+    sources = [RandomSource() for _ in range(5)]
+
+    datapoints = await fetch_new_datapoints(sources, max_workers=2)
+
+    assert len(datapoints) == 5
+    for s, (v, t) in zip(sources, datapoints):
+        assert isinstance(v, float)
+        assert isinstance(t, datetime)
+        assert s.latest == (v, t)
+
+    with pytest.raises(ValueError):
+        await fetch_new_datapoints(sources, max_workers=0)
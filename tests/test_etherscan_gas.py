@@ -48,3 +48,10 @@ async def test_etherscan_gas_error(caplog):
         assert result[0] is None
         assert result[1] is None
         assert "Key error" in caplog.text
+
+
+def test_etherscan_gas_session_not_compared():
+    """The cached HTTP session is not part of the source's equality"""
+    c = EtherscanGasPriceSource()
+    c._get_session()
+    assert c == EtherscanGasPriceSource()
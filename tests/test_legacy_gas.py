@@ -0,0 +1,55 @@
+import json
+from unittest import mock
+
+import pytest
+
+from telliot_core.gas import legacy_gas
+from telliot_core.gas.legacy_gas import ethgasstation
+
+
+@pytest.mark.asyncio
+async def test_ethgasstation_cache():
+    """Test that gas prices are cached for max_age seconds"""
+    legacy_gas._gas_price_cache.clear()
+
+    with mock.patch("telliot_core.gas.legacy_gas._fetch_ethgasstation", return_value=42) as fetch:
+        assert await ethgasstation("fast") == 42
+        assert await ethgasstation("fast") == 42
+        assert fetch.await_count == 1
+
+        # Expired entries are fetched again
+        assert await ethgasstation("fast", max_age=0) == 42
+        assert fetch.await_count == 2
+
+    legacy_gas._gas_price_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_ethgasstation_failure_not_cached():
+    """Test that failed fetches are not cached"""
+    legacy_gas._gas_price_cache.clear()
+
+    with mock.patch("telliot_core.gas.legacy_gas._fetch_ethgasstation", return_value=None) as fetch:
+        assert await ethgasstation("fast") is None
+        assert await ethgasstation("fast") is None
+        assert fetch.await_count == 2
+
+    assert "fast" not in legacy_gas._gas_price_cache
+
+
+@pytest.mark.asyncio
+async def test_fetch_ethgasstation():
+    """Test parsing of the API response and retries on invalid JSON"""
+    session = mock.MagicMock()
+    rsp = session.get.return_value.__aenter__.return_value
+    rsp.text = mock.AsyncMock(side_effect=["not json", json.dumps({"fast": 425, "average": 300})])
+
+    gas_price = await legacy_gas._fetch_ethgasstation("fast", retries=2, session=session)
+
+    assert gas_price == 42  # API prices are gwei * 10
+    assert session.get.call_count == 2
+    session.get.assert_called_with(legacy_gas.ETHGASSTATION_URL)
+
+    rsp.text = mock.AsyncMock(return_value="not json")
+    assert await legacy_gas._fetch_ethgasstation("fast", retries=2, session=session) is None
+    assert rsp.text.await_count == 2
@@ -0,0 +1,36 @@
+from unittest import mock
+
+from telliot_core.pricing.price_service import WebPriceService
+
+
+class FakePriceService(WebPriceService):
+    async def get_price(self, asset, currency):
+        return None, None
+
+
+def test_get_url_reuses_session():
+    """Requests share one lazily created HTTP session"""
+    service = FakePriceService(name="fake", url="https://example.com/")
+
+    with mock.patch("requests.Session") as Session:
+        Session.return_value.get.return_value.json.return_value = {"price": 1.0}
+
+        assert service.get_url("a") == {"response": {"price": 1.0}}
+        assert service.get_url("b") == {"response": {"price": 1.0}}
+
+    Session.assert_called_once()
+    urls = [c.args[0] for c in Session.return_value.get.call_args_list]
+    assert urls == ["https://example.com/a", "https://example.com/b"]
+
+
+def test_get_url_without_base_init():
+    """Subclasses that do not call WebPriceService.__init__ still get a session"""
+
+    class BareService(FakePriceService):
+        def __init__(self):
+            self.url = "https://example.com/"
+            self.timeout = 1.0
+
+    with mock.patch("requests.Session") as Session:
+        Session.return_value.get.return_value.json.return_value = []
+        assert BareService().get_url() == {"response": []}
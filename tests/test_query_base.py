@@ -33,3 +33,14 @@ def test_query_from_state():
     print(q)
     assert isinstance(q, SpotPrice)
     assert q.asset == "ohm"
+
+
+def test_descriptor_cache():
+    q = SpotPrice(asset="btc", currency="usd")
+    assert q.descriptor == '{"type":"SpotPrice","asset":"btc","currency":"usd"}'
+    assert q.descriptor is q.descriptor
+
+    # Changing a parameter invalidates the cached descriptor
+    q.currency = "eth"
+    assert q.descriptor == '{"type":"SpotPrice","asset":"btc","currency":"eth"}'
+    assert "_descriptor" not in q.get_state()
@@ -3,6 +3,8 @@
 Copyright (c) 2021-, Tellor Development Community
 Distributed under the terms of the MIT License.
 """
+from unittest import mock
+
 import pytest
 
 from telliot_core.queries.price.spot_price import SpotPrice
@@ -63,3 +65,15 @@ def test_vsq_usd_spot_price():
 def test_bct_usd_spot_price():
     q = SpotPrice(asset="bct", currency="usd")
     assert q.query_id.hex() == "35e083af947a4cf3bc053440c3b4f753433c76acab6c8b1911ee808104b72e85"
+
+
+def test_spot_price_pairs_loaded_once():
+    """The compatibility `spot_price_pairs` attribute reuses the cached pairs file"""
+    from telliot_core.queries.price import spot_price
+
+    spot_price.spot_price_pairs
+    with mock.patch.object(spot_price, "get_spot_price_pairs") as get_pairs:
+        pairs = spot_price.spot_price_pairs
+        get_pairs.assert_not_called()
+
+    assert ("btc", "usd") in pairs
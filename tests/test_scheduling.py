@@ -0,0 +1,136 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from telliot_core.utils.scheduling import pipeline
+from telliot_core.utils.scheduling import ticker
+
+
+class FakeClock:
+    """Deterministic stand-in for the monotonic clock and asyncio.sleep"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+    def patch(self):
+        return mock.patch.multiple(
+            "telliot_core.utils.scheduling",
+            time=mock.Mock(monotonic=self.monotonic),
+            asyncio=mock.Mock(sleep=self.sleep),
+        )
+
+
+@pytest.mark.asyncio
+async def test_ticker_does_not_drift():
+    """Time spent handling a tick does not delay the next one"""
+    clock = FakeClock()
+    ticks = []
+
+    with clock.patch():
+        async for t in ticker(1.0):
+            ticks.append(t)
+            if len(ticks) == 4:
+                break
+            clock.now += 0.75  # handling the tick
+
+    assert ticks == [0.0, 1.0, 2.0, 3.0]
+    assert clock.sleeps == [0.25] * 3
+    assert clock.now == 3.0
+
+
+@pytest.mark.asyncio
+async def test_ticker_skips_missed_ticks():
+    """Ticks missed while handling a slow tick are skipped"""
+    clock = FakeClock()
+    ticks = []
+
+    with clock.patch():
+        async for t in ticker(1.0):
+            ticks.append(t)
+            if len(ticks) == 2:
+                break
+            clock.now += 2.5  # overruns two intervals
+
+    assert ticks == [0.0, 3.0]
+    assert clock.sleeps == [0.5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("interval", [0, -1.0])
+async def test_ticker_invalid_interval(interval):
+    with pytest.raises(ValueError):
+        async for _ in ticker(interval):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_pipeline_overlaps_produce_and_consume():
+    """The next item is produced while the previous one is being consumed"""
+
+    class Done(Exception):
+        pass
+
+    events = []
+    count = 0
+
+    async def produce():
+        nonlocal count
+        count += 1
+        events.append(("produce", count))
+        await asyncio.sleep(0.02)
+        return count
+
+    async def consume(item):
+        events.append(("consume start", item))
+        await asyncio.sleep(0.03)
+        events.append(("consume end", item))
+        if len([e for e in events if e[0] == "consume end"]) == 3:
+            raise Done
+
+    with pytest.raises(Done):
+        await pipeline(produce, consume, interval=0.01)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    consumed = [item for name, item in events if name == "consume end"]
+    assert consumed == sorted(set(consumed))
+    assert events.index(("produce", 2)) < events.index(("consume end", 1))
+
+
+@pytest.mark.asyncio
+async def test_pipeline_consumes_newest():
+    """Results not yet consumed are replaced by newer ones"""
+
+    class Done(Exception):
+        pass
+
+    produced = 0
+    consumed = []
+
+    async def produce():
+        nonlocal produced
+        produced += 1
+        return produced
+
+    async def consume(item):
+        # The item handed over is always the most recently produced one
+        assert item == produced
+        consumed.append(item)
+        if len(consumed) == 2:
+            raise Done
+        await asyncio.sleep(0.05)
+
+    with pytest.raises(Done):
+        await pipeline(produce, consume, interval=0.01)
+
+    assert consumed[0] == 1
+    assert consumed[1] > 2
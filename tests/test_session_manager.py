@@ -1,4 +1,5 @@
 import asyncio
+import gc
 
 import pytest
 
@@ -62,3 +63,23 @@ async def test_session(client_session):
         "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd"
     )
     assert "bitcoin" in result
+
+
+def test_del_keeps_event_loop():
+    """Deleting an open manager outside a running loop leaves the thread's loop alone"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        cm = ClientSessionManager()
+        loop.run_until_complete(cm.open())
+        session = cm.session
+
+        del cm
+        gc.collect()
+
+        assert session.closed
+        assert asyncio.get_event_loop() is loop
+        assert not loop.is_closed()
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
@@ -68,3 +68,14 @@ def test_unsigned_float_value():
     decoded_value = f.decode(encoded_value)
     assert isinstance(decoded_value, float)
     assert decoded_value == 99.000001
+
+
+@pytest.mark.parametrize("abi_type,packed", [("ufixed256x18", False), ("ufixed64x6", False), ("ufixed64x6", True)])
+def test_unsigned_float_matches_abi_encoding(abi_type, packed):
+    """The direct float encoder must match the generic ABI encoder"""
+    f = UnsignedFloatType(abi_type=abi_type, packed=packed)
+    generic = ValueType(abi_type=abi_type, packed=packed)
+
+    for value in [0, 1, 99.0000009, 116.788, Decimal("116.788")]:
+        decimal_value = Decimal(value).quantize(Decimal(10) ** -f.decimals)
+        assert f.encode(value) == generic.encode(decimal_value)